@@ -1,14 +1,25 @@
 from curses.ascii import isupper
 import os
+import copy
 import json
+import hashlib
 import PyPDF2
 import logging
 import regex as re
 from sys import stdout
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+
+from lxml import etree
+from concurrent.futures import ProcessPoolExecutor
 
 from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from docx.oxml.document import CT_Body
 from docx.shared import Pt
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_BREAK
+from docx.enum.style import WD_STYLE_TYPE
+from docx.styles.style import BaseStyle
 
 from typing import List
 
@@ -31,6 +42,16 @@ class ProcedurePDF:
     SECTION_SUB_HEADING = "section_subheading"
     SECTION_TEXT = "section_text"
 
+    DATA_FOLDER = "data"                                    # Folder where the PDF files are stored
+    CACHE_FOLDER = os.path.join(DATA_FOLDER,".bcpcache")    # Folder where the section manifests and extraction caches are stored
+
+    # Version of the parsed section data in the extraction cache
+    # Increase this when the way the text is split into sections or formatted changes so old caches are not used
+    PARSER_VERSION = 1
+
+    # Font programs are not used to extract text and are expensive to read, so they are left out of the page hash
+    PAGE_HASH_SKIP_KEYS = ("/FontFile","/FontFile2","/FontFile3")
+
     """
     Class to handle a SINGLE (.pdf) file from the Procedure (Part D) from Blackstone's Criminal Practice 2022 from Lexis Library.
 
@@ -46,9 +67,93 @@ class ProcedurePDF:
 
     def __init__(self,filename:str) -> None:
         self.filename = filename
+        self.extraction_cache = self._readExtractionCache()    # Cached page text and section data from the last time the PDF file was parsed
         self.pdf_text = self._getPDFText()
         self.pdf_dict = self._getPDFDict()
 
+        if self.pdf_dict != None:
+            self._writeSectionManifest()
+            self._writeExtractionCache()
+
+    @classmethod
+    def getPDFPath(cls,filename:str) -> str:
+        """
+        Gets the path to the PDF file for a section.
+
+        PARAMETERS
+        ----------
+        filename : str
+            The name of the PDF file without the PDF Extension.
+
+        RETURNS
+        -------
+        str : The path to the PDF file within the data folder.
+        """
+        return os.path.join(cls.DATA_FOLDER,f'{filename}.pdf')
+
+    @classmethod
+    def getManifestPath(cls,filename:str) -> str:
+        """
+        Gets the path to the section manifest for a section.
+
+        PARAMETERS
+        ----------
+        filename : str
+            The name of the PDF file without the PDF Extension.
+
+        RETURNS
+        -------
+        str : The path to the section manifest within the cache folder.
+        """
+        return os.path.join(cls.CACHE_FOLDER,f'{filename}.manifest.json')
+
+    @classmethod
+    def getExtractionCachePath(cls,filename:str) -> str:
+        """
+        Gets the path to the extraction cache for a section.
+
+        PARAMETERS
+        ----------
+        filename : str
+            The name of the PDF file without the PDF Extension.
+
+        RETURNS
+        -------
+        str : The path to the extraction cache within the cache folder.
+        """
+        return os.path.join(cls.CACHE_FOLDER,f'{filename}.pages.json')
+
+    @classmethod
+    def readSectionManifest(cls,filename:str) -> List[str]:
+        """
+        Reads the list of subsections that were found the last time the PDF file was parsed. This does not open the PDF file so it can be used to check the subsections before parsing.
+
+        The manifest is ignored if the PDF file has changed in size or modification time since the manifest was written.
+
+        PARAMETERS
+        ----------
+        filename : str
+            The name of the PDF file without the PDF Extension.
+
+        RETURNS
+        -------
+        List[str] : A list of the subsections in the PDF file (i.e. D5.1) or None if there is no up to date manifest.
+        """
+        try:
+            stat = os.stat(cls.getPDFPath(filename))
+            with open(cls.getManifestPath(filename)) as f:
+                manifest = json.load(f)
+        except (OSError,ValueError):
+            return None
+
+        if not isinstance(manifest,dict) or not isinstance(manifest.get('sections'),list):
+            return None     # Manifest is not in the expected format
+
+        if manifest.get('source_size') != stat.st_size or manifest.get('source_mtime') != stat.st_mtime_ns:
+            return None     # PDF file has changed since the manifest was written
+
+        return manifest.get('sections')
+
     def getSections(self,sections:List[int]) -> dict:
         """
         Returns a dictionary of the sections that are entered as a list of integers in this function.
@@ -93,7 +198,7 @@ class ProcedurePDF:
         str : A long string of all the text within the PDF file.
         """
         # Open the File
-        filepath = os.path.join('data',f'{self.filename}.pdf')
+        filepath = self.getPDFPath(self.filename)
 
         try:
             file = open(filepath,'rb')
@@ -104,15 +209,33 @@ class ProcedurePDF:
             # Create Reader Object
             reader = PyPDF2.PdfFileReader(file)
 
+            cached_pages = self.extraction_cache['pages']
+            self.extraction_cache['pages'] = {}     # Only keep the pages that are in the current PDF file
+            object_hashes = {}                      # Hashes of objects shared between pages (i.e. fonts) so they are only hashed once
+
             # Get the Text
             text = ''
+            extracted = 0
 
             for i in range(reader.numPages):
-                page = reader.getPage(i)                # Get the Current Page
-                current_text = page.extract_text()      # Extract the text from the current page
+                page = reader.getPage(i)                            # Get the Current Page
+                page_hash = self._getPageHash(page,object_hashes)   # Hash of the content stream and resources of the current page
+
+                if page_hash in cached_pages:
+                    current_text = cached_pages[page_hash]          # Page has not changed, reuse the text from the cache
+                else:
+                    current_text = page.extract_text()              # Extract the text from the current page
+                    extracted += 1
+
+                # Pages that cannot be hashed are always extracted and are not cached
+                if page_hash != None:
+                    self.extraction_cache['pages'].update({page_hash: current_text})
+
                 text += current_text                    # Append to master 'text' variable
                 text += '\n'                            # Add New Line character to the end of every page
 
+            logging.info(f'[PDFs]: Extracted {extracted} of {reader.numPages} pages for {self.filename}')
+
             file.close()
             
             return text
@@ -153,52 +276,326 @@ class ProcedurePDF:
 
         text_dict = {}
 
+        cached_documents = self.extraction_cache['documents']
+        self.extraction_cache['documents'] = {}     # Only keep the documents that are in the current PDF file
+
         for page in pages:
 
-            # << Split the array to obtain the title and text data >>
-            page_data = self._splitPageContentByBlackstone(page)
+            # The data for a document only depends on its text and the headings before it, so unchanged documents are reused from the cache
+            document_hash = self._getHash(main_heading,sub_heading,page)
 
-            # Only work on arrays with a length more than 1
-            # At the very end of the document, there'll be a "End of Document" with a linespace after. This will register as the last element of the array
-            if len(page_data) > 1:
+            if document_hash in cached_documents:
+                document_dict, main_heading, sub_heading = cached_documents[document_hash]
+            else:
+                document_dict, main_heading, sub_heading = self._getDocumentDict(page,main_heading,sub_heading)
 
-                # << Get the page heading and text >>
-                page_heading = self._getPageHeading(page_data)
-                page_text = self._getPageText(page_data)
+            self.extraction_cache['documents'].update({document_hash: [document_dict,main_heading,sub_heading]})
 
-                # << Update Headings >>
-                # Headings with all caps are main headings
-                # Headings with standard letters are sub headings
-                if self._isPageHeadingUpper(page_heading):
-                    # Update Main Heading and Reset Sub Heading
-                    main_heading = page_heading
-                    sub_heading = ''
-                else:
-                    # Update Sub Heading
-                    sub_heading = page_heading
+            # << Update the main dictionary with the document dictionary >>
+            text_dict.update(document_dict)
+
+        return text_dict
+
+    def _getDocumentDict(self,page:str,main_heading:str,sub_heading:str) -> tuple:
+        """
+        Gets the sections from the text of a single document (Split by "End of Document", not referring to the PDF).
+
+        PARAMETERS
+        ----------
+        page : str
+            The text from the current document.
+
+        main_heading : str
+            The main heading before this document.
+
+        sub_heading : str
+            The sub heading before this document.
+
+        RETURNS
+        -------
+        tuple : A dictionary of the sections in this document in the same format as ProcedurePDF._getPDFDict(), followed by the main heading and sub heading after this document.
 
-                # << Get the sections and section text in the page text >>
-                section_regex = re.escape(self.filename) + r'\.\d{1,3}\n'           # Create a regex to idenfity section headers (i.e. D4.52)
-                sections = self._getPageSections(section_regex,page_text)           # Gets the list of sections that are in the page text
-                section_texts = self._getPageSectionTexts(section_regex,page_text)  # Gets the list of section texts that are in the page text
+        SEE ALSO
+        --------
+        ProcedurePDF._getPDFDict()
+        """
+        text_dict = {}
 
-                # Check if there are any sections on this page.
-                # Only proceed if there are sections on the page.
-                if len(sections) > 0:
-                    # There are sections, proceed to split
+        # << Split the array to obtain the title and text data >>
+        page_data = self._splitPageContentByBlackstone(page)
 
-                    for section, section_text in zip(sections,section_texts):
+        # Only work on arrays with a length more than 1
+        # At the very end of the document, there'll be a "End of Document" with a linespace after. This will register as the last element of the array
+        if len(page_data) > 1:
 
-                        # << Format the section text into the desired format >>
-                        section_text = self._formatSectionText(section_text,page_heading)
+            # << Get the page heading and text >>
+            page_heading = self._getPageHeading(page_data)
+            page_text = self._getPageText(page_data)
 
-                        # << Get the Data in Dictionary Format >>
-                        section_dict = self._getSectionDict(section,main_heading,sub_heading,section_text)
+            # << Update Headings >>
+            # Headings with all caps are main headings
+            # Headings with standard letters are sub headings
+            if self._isPageHeadingUpper(page_heading):
+                # Update Main Heading and Reset Sub Heading
+                main_heading = page_heading
+                sub_heading = ''
+            else:
+                # Update Sub Heading
+                sub_heading = page_heading
 
-                        # << Update the main dictionary with the section dictionary >>
-                        text_dict.update(section_dict)
+            # << Get the sections and section text in the page text >>
+            section_regex = re.escape(self.filename) + r'\.\d{1,3}\n'           # Create a regex to idenfity section headers (i.e. D4.52)
+            sections = self._getPageSections(section_regex,page_text)           # Gets the list of sections that are in the page text
+            section_texts = self._getPageSectionTexts(section_regex,page_text)  # Gets the list of section texts that are in the page text
 
-        return text_dict
+            # Check if there are any sections on this page.
+            # Only proceed if there are sections on the page.
+            if len(sections) > 0:
+                # There are sections, proceed to split
+
+                for section, section_text in zip(sections,section_texts):
+
+                    # << Format the section text into the desired format >>
+                    section_text = self._formatSectionText(section_text,page_heading)
+
+                    # << Get the Data in Dictionary Format >>
+                    section_dict = self._getSectionDict(section,main_heading,sub_heading,section_text)
+
+                    # << Update the main dictionary with the section dictionary >>
+                    text_dict.update(section_dict)
+
+        return text_dict, main_heading, sub_heading
+
+    def _getPageHash(self,page:PyPDF2.PageObject,object_hashes:dict) -> str:
+        """
+        Gets a hash of the raw content stream and resources of a PDF page. The hash only changes if the text extracted from the page can change.
+
+        PARAMETERS
+        ----------
+        page : PyPDF2.PageObject
+            The page from the PDF file.
+
+        object_hashes : dict
+            Hashes of the indirect objects that have already been hashed, with the object number as the key.
+
+        RETURNS
+        -------
+        str : The hash of the page or None if the page refers to an object that refers back to itself.
+        """
+        digest = hashlib.sha256()
+
+        for key in ("/Contents","/Resources","/Rotate"):
+            digest.update(key.encode())
+            if key in page:
+                object_hash = self._hashPDFObject(page.raw_get(key),object_hashes)
+
+                if object_hash == None:
+                    return None
+
+                digest.update(object_hash)
+
+        return digest.hexdigest()
+
+    def _hashPDFObject(self,obj,object_hashes:dict) -> bytes:
+        """
+        Hashes a PDF object and all the objects that it refers to. Streams are hashed using their raw (encoded) data so they do not have to be decoded.
+
+        If an object refers back to an object that is still being hashed, the hash would not include the content of that object. None is returned instead and nothing that depends on it is stored in object_hashes, so the page is always extracted.
+
+        PARAMETERS
+        ----------
+        obj : PdfObject
+            The object from the PDF file.
+
+        object_hashes : dict
+            Hashes of the indirect objects that have already been hashed, with the object number as the key. A None value means the object is still being hashed.
+
+        RETURNS
+        -------
+        bytes : The hash of the object or None if the object refers back to an object that is still being hashed.
+        """
+        if isinstance(obj,IndirectObject):
+            if obj.idnum in object_hashes:
+                return object_hashes[obj.idnum]     # None if the object is still being hashed
+
+            object_hashes.update({obj.idnum: None})
+            object_hash = self._hashPDFObject(obj.get_object(),object_hashes)
+
+            if object_hash == None:
+                del object_hashes[obj.idnum]        # Only complete hashes are kept
+            else:
+                object_hashes.update({obj.idnum: object_hash})
+
+            return object_hash
+
+        digest = hashlib.sha256(type(obj).__name__.encode())
+
+        if isinstance(obj,DictionaryObject):
+            for key in sorted(obj.keys()):
+                if key in self.PAGE_HASH_SKIP_KEYS:
+                    continue
+
+                object_hash = self._hashPDFObject(obj.raw_get(key),object_hashes)
+
+                if object_hash == None:
+                    return None
+
+                digest.update(key.encode())
+                digest.update(object_hash)
+
+            if isinstance(obj,StreamObject):
+                digest.update(obj._data)
+        elif isinstance(obj,ArrayObject):
+            for item in obj:
+                object_hash = self._hashPDFObject(item,object_hashes)
+
+                if object_hash == None:
+                    return None
+
+                digest.update(object_hash)
+        else:
+            digest.update(repr(obj).encode())
+
+        return digest.digest()
+
+    def _getHash(self,*texts:str) -> str:
+        """
+        Gets a hash of one or more strings.
+
+        PARAMETERS
+        ----------
+        texts : str
+            The strings to be hashed.
+
+        RETURNS
+        -------
+        str : The hash of the strings.
+        """
+        digest = hashlib.sha256()
+
+        for text in texts:
+            digest.update(text.encode())
+            digest.update(b'\0')       # Separator so that ("ab","c") and ("a","bc") have different hashes
+
+        return digest.hexdigest()
+
+    def _readExtractionCache(self) -> dict:
+        """
+        Reads the page text and section data that were cached the last time the PDF file was parsed. The cache is ignored if it was written by a different version of PyPDF2 as the extracted text may be different, if it was written by a different PARSER_VERSION as the section data may be different, or if it is not in the expected format.
+
+        PARAMETERS
+        ----------
+        None
+
+        RETURNS
+        -------
+        dict : The extraction cache.
+
+        dict({
+            "pypdf2_version": "<version>",
+            "parser_version": <version>,
+            "pages": dict({
+                "<page_hash>": "<page_text>"
+            }),
+            "documents": dict({
+                "<document_hash>": [<document_dict>,"<main_heading>","<sub_heading>"]
+            })
+        })
+        """
+        empty_cache = {'pypdf2_version': PyPDF2.__version__,'parser_version': self.PARSER_VERSION,'pages': {},'documents': {}}
+
+        try:
+            with open(self.getExtractionCachePath(self.filename)) as f:
+                cache = json.load(f)
+        except (OSError,ValueError):
+            return empty_cache
+
+        if not isinstance(cache,dict):
+            return empty_cache
+
+        if cache.get('pypdf2_version') != PyPDF2.__version__ or cache.get('parser_version') != self.PARSER_VERSION:
+            return empty_cache
+
+        pages = cache.get('pages')
+        documents = cache.get('documents')
+
+        if not isinstance(pages,dict) or not all(isinstance(text,str) for text in pages.values()):
+            return empty_cache
+
+        if not isinstance(documents,dict) or not all(self._isCachedDocument(document) for document in documents.values()):
+            return empty_cache
+
+        return cache
+
+    def _isCachedDocument(self,document:list) -> bool:
+        """
+        Checks that a document from the extraction cache is in the format returned by ProcedurePDF._getDocumentDict().
+
+        PARAMETERS
+        ----------
+        document : list
+            The cached document.
+
+        RETURNS
+        -------
+        bool : True if the document is in the expected format, False if not.
+        """
+        return isinstance(document,list) and len(document) == 3 and isinstance(document[0],dict) and isinstance(document[1],str) and isinstance(document[2],str)
+
+    def _writeExtractionCache(self) -> None:
+        """
+        Writes the page text and section data for the current PDF file to the extraction cache.
+
+        PARAMETERS
+        ----------
+        None
+
+        RETURNS
+        -------
+        None
+
+        SEE ALSO
+        --------
+        ProcedurePDF._readExtractionCache()
+        """
+        try:
+            os.makedirs(self.CACHE_FOLDER,exist_ok=True)
+
+            with open(self.getExtractionCachePath(self.filename),'w') as f:
+                json.dump(self.extraction_cache,f)
+        except OSError:
+            # The cache only speeds up parsing, the document can still be generated without it
+            logging.warning(f'[PDFs]: Unable to write extraction cache for {self.filename}')
+
+    def _writeSectionManifest(self) -> None:
+        """
+        Writes the list of subsections found in the PDF file to the section manifest so that instruction files can be validated without parsing the PDF file again.
+
+        PARAMETERS
+        ----------
+        None
+
+        RETURNS
+        -------
+        None
+
+        SEE ALSO
+        --------
+        ProcedurePDF.readSectionManifest()
+        """
+        try:
+            stat = os.stat(self.getPDFPath(self.filename))
+            os.makedirs(self.CACHE_FOLDER,exist_ok=True)
+
+            with open(self.getManifestPath(self.filename),'w') as f:
+                json.dump({
+                    'source_size': stat.st_size,
+                    'source_mtime': stat.st_mtime_ns,
+                    'sections': list(self.pdf_dict.keys())
+                },f)
+        except OSError:
+            # The manifest is only used to speed up validation, the document can still be generated without it
+            logging.warning(f'[PDFs]: Unable to write section manifest for {self.filename}')
 
     def _getSectionDict(self,subsection:str,main_heading:str,sub_heading:str,subsection_text:List[str]) -> dict:
         """
@@ -486,6 +883,275 @@ class Topic:
         self.sections_data = data['sections']           # Topic Sections and Subsections [dict]
         self.sections = self.sections_data.keys()       # Topic Sections [List[str]]
 
+class InstructionValidator:
+
+    """
+    This class checks a JSON instruction file before any PDF file is parsed. It checks the structure of the data, that the PDF files exist and that the subsections are in the section manifests of the PDF files.
+
+    Subsections can only be checked before parsing for PDF files that have been parsed before. For the other PDF files, the data should be validated again with the loaded ProcedurePDF objects.
+
+    PARAMETERS
+    ----------
+    data : dict
+        The data within the JSON file.
+
+    pdfs : dict, default = None
+        Dictionary of section and the loaded ProcedurePDF objects. The subsections of these sections are checked against the loaded PDF instead of the section manifest.
+
+    RETURNS
+    -------
+    None
+    """
+
+    def __init__(self,data:dict,pdfs:dict=None) -> None:
+        self.data = data            # JSON Data [dict]
+        self.pdfs = pdfs or {}      # Loaded PDFs [dict]
+        self.problems = []          # Problems found with the JSON data [List[str]]
+
+    def validate(self) -> List[str]:
+        """
+        Checks the JSON data and returns all the problems that are found.
+
+        PARAMETERS
+        ----------
+        None
+
+        RETURNS
+        -------
+        List[str] : A list of messages describing each problem. The list is empty if the data is valid.
+        """
+        self.problems = []
+
+        if self.data == None:
+            self.problems.append('The JSON file could not be read or is not valid JSON.')
+            return self.problems
+
+        if not isinstance(self.data,dict):
+            self.problems.append('The JSON data should be an object with the keys "doc_title" and "doc_data".')
+            return self.problems
+
+        if not isinstance(self.data.get('doc_title'),str) or self.data.get('doc_title') == '':
+            self.problems.append('"doc_title" should be a non-empty string.')
+
+        doc_data = self.data.get('doc_data')
+
+        if not isinstance(doc_data,dict):
+            self.problems.append('"doc_data" should be an object of topics.')
+            return self.problems
+
+        sections = {}       # "dict" - Dictionary of section and the subsections requested across all topics
+
+        for topic_name, topic_data in doc_data.items():
+            for section, subsections in self._validateTopic(topic_name,topic_data).items():
+                sections.setdefault(section,set()).update(subsections)
+
+        for section, subsections in sections.items():
+            self._validateSection(section,subsections)
+
+        return self.problems
+
+    def _validateTopic(self,topic_name:str,topic_data:dict) -> dict:
+        """
+        Checks the structure of a single topic.
+
+        PARAMETERS
+        ----------
+        topic_name : str
+            The name of the topic (i.e. Topic 1).
+
+        topic_data : dict
+            The data for this topic.
+
+        RETURNS
+        -------
+        dict : A dictionary of the valid sections and subsections in this topic.
+
+        dict({
+            "<section>": [1,2,3]
+        })
+        """
+        if not isinstance(topic_data,dict):
+            self.problems.append(f'{topic_name}: The topic should be an object with the keys "title" and "sections".')
+            return {}
+
+        if not isinstance(topic_data.get('title'),str):
+            self.problems.append(f'{topic_name}: "title" should be a string.')
+
+        sections_data = topic_data.get('sections')
+
+        if not isinstance(sections_data,dict):
+            self.problems.append(f'{topic_name}: "sections" should be an object of sections and subsections.')
+            return {}
+
+        sections = {}
+
+        for section, subsections in sections_data.items():
+            # bool is a subclass of int so it has to be excluded separately
+            if not isinstance(subsections,list) or not all(isinstance(s,int) and not isinstance(s,bool) for s in subsections):
+                self.problems.append(f'{topic_name}: The subsections for {section} should be a list of integers.')
+                continue
+
+            sections.update({section: subsections})
+
+        return sections
+
+    def _validateSection(self,section:str,subsections:set) -> None:
+        """
+        Checks that the PDF file for a section exists and that the subsections are in the loaded PDF or its section manifest.
+
+        PARAMETERS
+        ----------
+        section : str
+            The section, which is also the name of the PDF file (i.e. D5).
+
+        subsections : set
+            The subsections that are requested from this section.
+
+        RETURNS
+        -------
+        None
+        """
+        if not os.path.isfile(ProcedurePDF.getPDFPath(section)):
+            self.problems.append(f'{section}: The PDF file {ProcedurePDF.getPDFPath(section)} does not exist.')
+            return
+
+        if section in self.pdfs:
+            pdf_dict = self.pdfs[section].pdf_dict
+
+            if pdf_dict == None:
+                self.problems.append(f'{section}: The PDF file {ProcedurePDF.getPDFPath(section)} could not be read.')
+                return
+
+            manifest = list(pdf_dict.keys())
+        else:
+            manifest = ProcedurePDF.readSectionManifest(section)
+
+        if manifest == None:
+            logging.info(f'[Validate]: No section manifest for {section}, subsections will be checked when the PDF is loaded.')
+            return
+
+        missing = [str(s) for s in sorted(subsections) if f'{section}.{s}' not in manifest]
+
+        if len(missing) > 0:
+            self.problems.append(f'{section}: The subsections {", ".join(missing)} do not exist in {section}.pdf.')
+
+class DocumentSkeleton:
+
+    """
+    This class loads a word template once per process and adds the named styles used by DocxWriter. Every document is a copy of this skeleton so the template does not have to be parsed again for each document.
+
+    If the template already has a style with one of the names below, the style from the template is used so the formatting can be changed in the template.
+    """
+
+    TOPIC_TITLE_STYLE = "BCP Topic Title"           # Topic Number (i.e. Topic 1)
+    TOPIC_HEADING_STYLE = "BCP Topic Heading"       # Topic Title
+    SECTION_HEADING_STYLE = "BCP Section Heading"   # Subsection Heading (i.e. D5.1 - MAIN HEADING > Sub Heading)
+    BODY_TEXT_STYLE = "BCP Body Text"               # Justified Subsection Text
+
+    _skeletons = {}     # "dict" - Dictionary of the loaded skeletons (key: "[template]" as str | item: "[skeleton]" as Document)
+    _style_ids = {}     # "dict" - Dictionary of the style ids of the named styles in each skeleton (key: "[template]" as str | item: "[style_ids]" as dict)
+
+    @classmethod
+    def getDocument(cls,template:str=None) -> Document:
+        """
+        Gets a new document from the skeleton for a template. The template is only loaded the first time it is used in this process.
+
+        PARAMETERS
+        ----------
+        template : str, default = None
+            The path to a word document (.docx) to use as the template. If None, the default template from the docx module is used.
+
+        RETURNS
+        -------
+        Document : A new document with the named styles.
+        """
+        if template not in cls._skeletons:
+            cls._skeletons.update({template: cls._loadSkeleton(template)})
+
+        return copy.deepcopy(cls._skeletons[template])
+
+    @classmethod
+    def getStyleIds(cls,template:str=None) -> dict:
+        """
+        Gets the style ids of the named styles in the skeleton for a template. The style ids are the same in every document from .getDocument() so they are only looked up when the template is loaded.
+
+        PARAMETERS
+        ----------
+        template : str, default = None
+            The path to a word document (.docx) to use as the template. If None, the default template from the docx module is used.
+
+        RETURNS
+        -------
+        dict : A dictionary where the keys are the style names and the values are the style ids.
+        """
+        if template not in cls._skeletons:
+            cls._skeletons.update({template: cls._loadSkeleton(template)})
+
+        return cls._style_ids[template]
+
+    @classmethod
+    def _loadSkeleton(cls,template:str) -> Document:
+        """
+        Loads the template and adds the named styles to it.
+
+        PARAMETERS
+        ----------
+        template : str
+            The path to a word document (.docx) to use as the template. If None, the default template from the docx module is used.
+
+        RETURNS
+        -------
+        Document : The skeleton document.
+        """
+        logging.info(f'[Writing]: Loading template {template or "(default)"}')
+
+        doc = Document(template)
+
+        cls._addStyle(doc,cls.TOPIC_TITLE_STYLE,'Title')
+        cls._addStyle(doc,cls.TOPIC_HEADING_STYLE,'Heading 1')
+        cls._addStyle(doc,cls.SECTION_HEADING_STYLE,'Heading 2')
+
+        body_style = cls._addStyle(doc,cls.BODY_TEXT_STYLE,'Normal')
+        if body_style != None:
+            body_style.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+            body_style.paragraph_format.space_after = Pt(6)
+
+        names = (cls.TOPIC_TITLE_STYLE,cls.TOPIC_HEADING_STYLE,cls.SECTION_HEADING_STYLE,cls.BODY_TEXT_STYLE)
+        cls._style_ids.update({template: {name: doc.styles[name].style_id for name in names}})
+
+        return doc
+
+    @classmethod
+    def _addStyle(cls,doc:Document,name:str,base_style:str) -> BaseStyle:
+        """
+        Adds a paragraph style to the document unless the document already has a style with this name.
+
+        PARAMETERS
+        ----------
+        doc : Document
+            The document that the style is added to.
+
+        name : str
+            The name of the style.
+
+        base_style : str
+            The name of the style that this style is based on. Heading styles keep their outline level through the base style.
+
+        RETURNS
+        -------
+        BaseStyle : The new paragraph style or None if the document already has a style with this name.
+        """
+        if name in doc.styles:
+            return None
+
+        style = doc.styles.add_style(name,WD_STYLE_TYPE.PARAGRAPH)
+
+        # Custom templates may not have the base style
+        if base_style in doc.styles:
+            style.base_style = doc.styles[base_style]
+
+        return style
+
 class DocxWriter:
 
     """
@@ -496,24 +1162,33 @@ class DocxWriter:
     json_path : str
         The path to the JSON file where the information is stored regarding the Topics, Sections and Subsections.
 
+    template : str, default = None
+        The path to a word document (.docx) to use as the template. If None, the default template from the docx module is used.
+
     RETURNS
     -------
     None
     """
 
-    def __init__(self,json_path:str) -> None:
+    # Starting the worker processes takes longer than rendering a small document, so smaller documents are rendered serially
+    PARALLEL_MIN_PARAGRAPHS = 2000
+
+    _fragment_documents = {}    # "dict" - Scratch documents used by ._renderTopicFragment() in each worker process (key: "[template]" as str | item: "[document]" as Document)
+
+    def __init__(self,json_path:str,template:str=None) -> None:
         self.json_path = json_path      # JSON File Path
+        self.template = template        # Template File Path
         self.log = Logger()             # Init Log
 
-        self.doc = Document()
+        self.doc = DocumentSkeleton.getDocument(self.template)
         self.data = self._getJSONData()             # Get the data in JSON Format
-        self.doc_title = self.data['doc_title']     # Title of the document to be saved.
-        self.doc_data = self.data['doc_data']       # Data dictionary of the topics and respective sections and subsections to extract.
+        self.doc_title = self.data.get('doc_title') if isinstance(self.data,dict) else None     # Title of the document to be saved.
+        self.doc_data = self.data.get('doc_data') if isinstance(self.data,dict) else None       # Data dictionary of the topics and respective sections and subsections to extract.
 
         self.topics = []        # "List[Topic]"" - List of topic objects
         self.pdfs = {}          # "dict" - Dictionary of section and the PDFs (key: "[section]" as str | item: "[pdf_str]" as str)
 
-    def createDocument(self,folder:str='') -> int:
+    def createDocument(self,folder:str='',processes:int=1) -> int:
         """
         Generates a document based on the data that is passed into the object. The document is saved in the folder specified in the function parameters. If no parameter is passed, it saves the document in the root directory.
 
@@ -522,24 +1197,44 @@ class DocxWriter:
         folder : str, default = ''
             The folder where the word document should be saved.
 
+        processes : int, default = 1
+            The number of worker processes used to render the topics. Use more than 1 to render the topics in parallel for large documents.
+
         RETURNS
         -------
         int : Exit Code
             Exit code to indicate if the program ran successfully.
+            0 - Document generated successfully.
+            1 - Error with loading the PDF files.
+            2 - The JSON file is not valid, refer to .validate().
         """
 
+        # << Validate the JSON Data before any PDF is parsed >>
+        problems = self.validate()
+
+        if len(problems) > 0:
+            for problem in problems:
+                logging.error(f'[Validate]: {problem}')
+            return 2
+
         # << Get Topics and PDFs >>
-        if self._getTopicsAndPDFs() != 0:
-            return self._getTopicsAndPDFs() # Error with generating topics and PDFs, refer to ._getTopicsAndPDFs()
+        exit_code = self._getTopicsAndPDFs()
+        if exit_code != 0:
+            return exit_code    # Error with generating topics and PDFs, refer to ._getTopicsAndPDFs()
 
-        # << Write the Data for Topics >>
-        for topic in self.topics:
-            if self._writeTopicData(topic) != 0:
-                return self._writeTopicData(topic) # Error with writing topic to word file, refer to ._writeTopicData()
+        # << Validate the JSON Data again with the loaded PDFs >>
+        # PDFs without a section manifest could not have their subsections checked before they were parsed
+        problems = self.validate()
 
-            # Add a Page Break unless it's the last topic
-            if topic != self.topics[-1]:
-                self.doc.add_page_break()
+        if len(problems) > 0:
+            for problem in problems:
+                logging.error(f'[Validate]: {problem}')
+            return 2
+
+        # << Write the Data for Topics >>
+        exit_code = self._writeTopics(processes)
+        if exit_code != 0:
+            return exit_code    # Error with writing topics to word file, refer to ._writeTopics()
 
         # Save the Document
         save_path = os.path.join(folder,f'{self.doc_title}.docx')
@@ -548,6 +1243,25 @@ class DocxWriter:
         # Return with Code 0 - Successful Generation of Document
         return 0
 
+    def validate(self) -> List[str]:
+        """
+        Checks the JSON data without parsing any PDF files. This checks the structure of the JSON data, that the PDF files exist and that the subsections exist for PDF files that have been loaded or parsed before.
+
+        PARAMETERS
+        ----------
+        None
+
+        RETURNS
+        -------
+        List[str] : A list of messages describing each problem. The list is empty if the JSON data is valid.
+
+        SEE ALSO
+        --------
+        InstructionValidator.validate()
+        """
+        logging.info('[Validate]: Validating JSON Data')
+        return InstructionValidator(self.data,self.pdfs).validate()
+
     def _getJSONData(self) -> dict:
         """
         Takes the file path given to the object and gets the JSON file. The JSON data is then converted into a dictionary.
@@ -568,16 +1282,126 @@ class DocxWriter:
             })
         })
         """
-        with open(self.json_path) as f:
-            logging.info('[JSON]: Loading JSON Data')
-            try:
+        logging.info('[JSON]: Loading JSON Data')
+        try:
+            with open(self.json_path) as f:
                 data = json.load(f)
-            except FileNotFoundError:
-                logging.error("[ERROR]: No Valid JSON File Found.")
-            else:
-                return data
+        except OSError:
+            logging.error("[ERROR]: No Valid JSON File Found.")
+        except ValueError as e:
+            logging.error(f"[ERROR]: The JSON File is not valid JSON - {e}")
+        else:
+            return data
+
+    def _writeTopics(self,processes:int=1) -> int:
+        """
+        Writes the data of all the topics to the document with a page break between each topic.
+
+        PARAMETERS
+        ----------
+        processes : int, default = 1
+            The maximum number of worker processes used to render the topics. If more than 1, each topic is rendered in parallel and merged into the document in topic order. The topics are rendered serially if there is only one CPU or fewer than PARALLEL_MIN_PARAGRAPHS paragraphs.
+
+        RETURNS
+        -------
+        int : Exit Code
+            Exit code to indicate if the program ran successfully.
+        """
+        # The PDF data is gathered once and used to count the paragraphs and to write the topics
+        topics_data = [self._getTopicData(topic) for topic in self.topics]
+
+        workers = min(processes,len(self.topics),os.cpu_count() or 1)
+
+        if workers > 1:
+            if self._countParagraphs(topics_data) >= self.PARALLEL_MIN_PARAGRAPHS:
+                return self._writeTopicsParallel(workers,topics_data)
 
-    def _writeTopicData(self,topic:Topic) -> int:
+            logging.info('[Writing]: Too few paragraphs to benefit from parallel rendering, rendering topics serially')
+        elif processes > 1:
+            logging.info('[Writing]: Only one CPU or topic available, rendering topics serially')
+
+        for topic, topic_data in zip(self.topics,topics_data):
+            exit_code = self._writeTopicData(topic,topic_data)
+            if exit_code != 0:
+                return exit_code    # Error with writing topic to word file, refer to ._writeTopicData()
+
+            # Add a Page Break unless it's the last topic
+            if topic != self.topics[-1]:
+                self.doc.add_page_break()
+
+        return 0
+
+    def _writeTopicsParallel(self,processes:int,topics_data:List[dict]) -> int:
+        """
+        Renders each topic into its own document body in worker processes. The bodies are then merged into the document in topic order with a page break between each topic. The merged document is the same as the one written by ._writeTopicData().
+
+        PARAMETERS
+        ----------
+        processes : int
+            The number of worker processes used to render the topics.
+
+        topics_data : List[dict]
+            The data for the subsections of each topic from ._getTopicData(), in topic order. Only this text is sent to the worker processes.
+
+        RETURNS
+        -------
+        int : Exit Code
+            Exit code to indicate if the program ran successfully.
+        """
+        topic_args = [(topic.topic,topic.title,topic_data,self.template) for topic, topic_data in zip(self.topics,topics_data)]
+
+        logging.info(f'[Writing]: Rendering {len(topic_args)} topics with {processes} processes')
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            fragments = list(executor.map(DocxWriter._renderTopicFragment,*zip(*topic_args)))   # .map() keeps the topic order
+
+        self._mergeTopicFragments(fragments)
+
+        return 0
+
+    def _mergeTopicFragments(self,fragments:List[bytes]) -> None:
+        """
+        Adds the document bodies from ._renderTopicFragment() to the document in order with a page break between each topic.
+
+        PARAMETERS
+        ----------
+        fragments : List[bytes]
+            The XML of the document body for each topic, in topic order.
+
+        RETURNS
+        -------
+        None
+        """
+        body = self.doc.element.body
+
+        for i, fragment in enumerate(fragments):
+            # Add a Page Break between topics
+            if i > 0:
+                self.doc.add_page_break()
+
+            # Everything in the fragment body is added before the section properties, which have to stay at the end of the body
+            # body.sectPr searches the whole body, so the position is found once and the elements are inserted together
+            elements = [element for element in parse_xml(fragment) if element.tag != qn('w:sectPr')]
+            sect_pr = body.sectPr
+            index = len(body) if sect_pr is None else body.index(sect_pr)
+            body[index:index] = elements
+
+    def _countParagraphs(self,topics_data:List[dict]) -> int:
+        """
+        Counts the number of text paragraphs that will be written for all the topics.
+
+        PARAMETERS
+        ----------
+        topics_data : List[dict]
+            The data for the subsections of each topic from ._getTopicData().
+
+        RETURNS
+        -------
+        int : The number of text paragraphs.
+        """
+        return sum(len(section_data[ProcedurePDF.SECTION_TEXT]) for topic_data in topics_data for section_data in topic_data.values())
+
+    def _writeTopicData(self,topic:Topic,topic_data:dict=None) -> int:
         """
         Writes the data of the topic to the document.
 
@@ -585,18 +1409,35 @@ class DocxWriter:
         ----------
         topic : Topic
             The topic object created from 'topics.json'.
+
+        topic_data : dict, default = None
+            The data for the subsections of the topic from ._getTopicData(). If None, it is gathered from the PDFs.
         
         RETURNS
         -------
         int : Exit Code
             Exit code to indicate if the program ran successfully.
         """
-        logging.info(f'[Writing]: Writing data for {topic.topic}: {topic.title}')
+        if topic_data == None:
+            topic_data = self._getTopicData(topic)
 
-        # Add the Topic Number and Topic Title as a "Title"
-        self.doc.add_heading(f"{topic.topic}",level=0)
-        self.doc.add_heading(f"{topic.title}",level=1)
+        self._renderTopic(self.doc,topic.topic,topic.title,topic_data,self.template)
+
+        return 0
+
+    def _getTopicData(self,topic:Topic) -> dict:
+        """
+        Gets the data for all the subsections of the topic from the PDFs.
 
+        PARAMETERS
+        ----------
+        topic : Topic
+            The topic object created from 'topics.json'.
+
+        RETURNS
+        -------
+        dict : A dictionary where all the keys are the subsections and the values are the section data from ProcedurePDF.getSections().
+        """
         topic_data = {}
 
         # Iterate through the Sections and Subsections
@@ -610,12 +1451,48 @@ class DocxWriter:
             section_dict = pdf.getSections(subsections)
             topic_data.update(section_dict)
 
+        return topic_data
+
+    @staticmethod
+    def _renderTopic(doc:Document,topic_name:str,topic_title:str,topic_data:dict,template:str=None) -> None:
+        """
+        Writes the headings and text of a topic to a document using the named styles from DocumentSkeleton.
+
+        PARAMETERS
+        ----------
+        doc : Document
+            The document from DocumentSkeleton.getDocument() that the topic is written to.
+
+        topic_name : str
+            The name of the topic (i.e. Topic 1).
+
+        topic_title : str
+            The title of the topic.
+
+        topic_data : dict
+            The data for the subsections of the topic from ._getTopicData().
+
+        template : str, default = None
+            The path to the word template that the document was created from.
+
+        RETURNS
+        -------
+        None
+        """
+        logging.info(f'[Writing]: Writing data for {topic_name}: {topic_title}')
+
+        style_ids = DocumentSkeleton.getStyleIds(template)
+
+        # Add the Topic Number and Topic Title as a "Title"
+        DocxWriter._addParagraph(doc,f"{topic_name}",style_ids[DocumentSkeleton.TOPIC_TITLE_STYLE])
+        DocxWriter._addParagraph(doc,f"{topic_title}",style_ids[DocumentSkeleton.TOPIC_HEADING_STYLE])
+
         for section_title, section_data in topic_data.items():
 
             # Writing the Section as a Level 1 Heading
-            section_main_heading = section_data[pdf.SECTION_MAIN_HEADING]
-            section_sub_heading = section_data[pdf.SECTION_SUB_HEADING]
-            section_text = section_data[pdf.SECTION_TEXT]
+            section_main_heading = section_data[ProcedurePDF.SECTION_MAIN_HEADING]
+            section_sub_heading = section_data[ProcedurePDF.SECTION_SUB_HEADING]
+            section_text = section_data[ProcedurePDF.SECTION_TEXT]
 
             section_heading = f"{section_title} - {section_main_heading}"
 
@@ -628,15 +1505,95 @@ class DocxWriter:
                     section_heading += f" > {section_sub_heading}"
 
             logging.info(f"[Writing]: Writing for Subsection {section_title}")
-            self.doc.add_heading(section_heading,level=2)
+            DocxWriter._addParagraph(doc,section_heading,style_ids[DocumentSkeleton.SECTION_HEADING_STYLE])
 
             # Writing the text data to the document
             for text_item in section_text:
-                para = self.doc.add_paragraph(text_item)
-                para.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-                para.paragraph_format.space_after = Pt(6)
+                DocxWriter._addParagraph(doc,text_item,style_ids[DocumentSkeleton.BODY_TEXT_STYLE])
 
-        return 0
+    @staticmethod
+    def _addParagraph(doc:Document,text:str,style_id:str) -> None:
+        """
+        Adds a paragraph to the document with a style id from DocumentSkeleton.getStyleIds().
+
+        PARAMETERS
+        ----------
+        doc : Document
+            The document that the paragraph is added to.
+
+        text : str
+            The text of the paragraph.
+
+        style_id : str
+            The id of the paragraph style.
+
+        RETURNS
+        -------
+        None
+        """
+        para = doc.add_paragraph(text)
+
+        # Document.add_paragraph(text,style) calls Styles.default() for every paragraph, which searches every style in the document.
+        # Setting the style id directly is what Paragraph.style does once the style id is known.
+        para._p.style = style_id
+
+    @staticmethod
+    def _renderTopicFragment(topic_name:str,topic_title:str,topic_data:dict,template:str=None) -> bytes:
+        """
+        Renders a topic into a scratch document and returns the XML of the document body. This runs in the worker processes of ._writeTopicsParallel().
+
+        Each worker process keeps one scratch document per template and empties its body after every topic, so the skeleton is only copied once per worker.
+
+        PARAMETERS
+        ----------
+        topic_name : str
+            The name of the topic (i.e. Topic 1).
+
+        topic_title : str
+            The title of the topic.
+
+        topic_data : dict
+            The data for the subsections of the topic from ._getTopicData().
+
+        template : str, default = None
+            The path to the word template used by the writer.
+
+        RETURNS
+        -------
+        bytes : The XML of the document body with only the topic written to it.
+        """
+        if template not in DocxWriter._fragment_documents:
+            DocxWriter._fragment_documents.update({template: DocumentSkeleton.getDocument(template)})
+
+        doc = DocxWriter._fragment_documents[template]
+        body = doc.element.body
+
+        # Content from the template is already in the main document, so only the topic is kept
+        DocxWriter._clearBody(body)
+
+        DocxWriter._renderTopic(doc,topic_name,topic_title,topic_data,template)
+        fragment = etree.tostring(body)
+
+        DocxWriter._clearBody(body)
+
+        return fragment
+
+    @staticmethod
+    def _clearBody(body:CT_Body) -> None:
+        """
+        Removes everything from a document body except the section properties.
+
+        PARAMETERS
+        ----------
+        body : CT_Body
+            The body element of the document.
+
+        RETURNS
+        -------
+        None
+        """
+        for element in [element for element in body if element.tag != qn('w:sectPr')]:
+            body.remove(element)
 
     def _getTopicsAndPDFs(self) -> int:
         """
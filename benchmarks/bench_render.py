@@ -0,0 +1,149 @@
+"""
+Benchmark for rendering topics into a word document with DocxWriter.
+
+Renders synthetic topics with the serial writer and with the parallel writer for different numbers of processes, checks that the documents are the same and prints the time taken. No PDF files are needed.
+
+The parallel writer is called directly so it is measured even when DocxWriter would fall back to the serial writer (i.e. on a machine with one CPU).
+
+Wall-clock times only show how the parallel writer scales on a machine with enough CPUs. The benchmark also measures each part of the parallel writer on its own:
+    * startup - starting the worker processes and loading the template in each of them.
+    * render  - rendering each topic into a fragment, measured in this process.
+    * merge   - merging the fragments into one document.
+From these, the time on N CPUs is estimated as startup + the time for N workers to render the fragments in topic order + merge. The estimate is labelled as such and is what DocxWriter.PARALLEL_MIN_PARAGRAPHS is based on.
+
+USAGE
+-----
+python benchmarks/bench_render.py [--topics 4 16 64] [--sections 40] [--processes 2 4]
+"""
+import os
+import sys
+import json
+import time
+import heapq
+import logging
+import argparse
+import tempfile
+
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..'))
+
+import bcpscrapper as bcp
+
+from lxml import etree
+
+PARAGRAPHS_PER_SECTION = 3
+
+class FakePDF:
+
+    """
+    Stands in for a ProcedurePDF object with generated section data.
+    """
+
+    def __init__(self,filename:str,paragraphs:int) -> None:
+        self.filename = filename
+        self.paragraphs = paragraphs
+
+    def getSections(self,sections:list) -> dict:
+        return {
+            f"{self.filename}.{section}": {
+                bcp.ProcedurePDF.SECTION_MAIN_HEADING: "MAIN HEADING",
+                bcp.ProcedurePDF.SECTION_SUB_HEADING: f"Sub heading {section}",
+                bcp.ProcedurePDF.SECTION_TEXT: [f"Paragraph {i} of {self.filename}.{section}. " * 20 for i in range(self.paragraphs)]
+            } for section in sections
+        }
+
+def createWriter(json_path:str,topics:int,sections:int) -> bcp.DocxWriter:
+    writer = bcp.DocxWriter(json_path)
+    writer.topics = [bcp.Topic(f"Topic {t}",{"title": f"Title {t}","sections": {f"D{t}": list(range(1,sections + 1))}}) for t in range(topics)]
+    writer.pdfs = {f"D{t}": FakePDF(f"D{t}",PARAGRAPHS_PER_SECTION) for t in range(topics)}
+    return writer
+
+def render(json_path:str,topics:int,sections:int,processes:int) -> tuple:
+    writer = createWriter(json_path,topics,sections)
+    start = time.perf_counter()
+
+    if processes > 1:
+        writer._writeTopicsParallel(processes,[writer._getTopicData(topic) for topic in writer.topics])
+    else:
+        writer._writeTopics(1)
+
+    return time.perf_counter() - start, etree.tostring(writer.doc.element.body)
+
+def measureStartup(processes:int) -> float:
+    # Each worker renders an empty topic, which loads the template in that worker
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        list(executor.map(bcp.DocxWriter._renderTopicFragment,["Topic"] * processes,["Title"] * processes,[{}] * processes))
+    return time.perf_counter() - start
+
+def measureParts(json_path:str,topics:int,sections:int) -> tuple:
+    writer = createWriter(json_path,topics,sections)
+    topics_data = [writer._getTopicData(topic) for topic in writer.topics]
+
+    render_times = []
+    fragments = []
+
+    for topic, topic_data in zip(writer.topics,topics_data):
+        start = time.perf_counter()
+        fragments.append(bcp.DocxWriter._renderTopicFragment(topic.topic,topic.title,topic_data))
+        render_times.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    writer._mergeTopicFragments(fragments)
+    merge_time = time.perf_counter() - start
+
+    return render_times, merge_time
+
+def renderMakespan(render_times:list,processes:int) -> float:
+    # executor.map hands the next topic to the first worker that is free
+    workers = [0.0] * processes
+    for render_time in render_times:
+        heapq.heappush(workers,heapq.heappop(workers) + render_time)
+    return max(workers)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--topics',type=int,nargs='+',default=[4,16,64])
+    parser.add_argument('--sections',type=int,default=40)
+    parser.add_argument('--processes',type=int,nargs='+',default=[2,4])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = os.path.join(folder,'bench.json')
+        with open(json_path,'w') as f:
+            json.dump({"doc_title": "bench","doc_data": {}},f)
+
+        print(f"CPUs: {os.cpu_count()}")
+        print()
+        print("Measured wall-clock time")
+        print(f"{'topics':>6} {'paragraphs':>10} {'processes':>9} {'seconds':>8} {'speedup':>7} {'same':>5}")
+
+        serial_times = {}
+
+        for topics in args.topics:
+            paragraphs = topics * args.sections * PARAGRAPHS_PER_SECTION
+            serial_time, serial_body = render(json_path,topics,args.sections,1)
+            serial_times.update({topics: serial_time})
+            print(f"{topics:>6} {paragraphs:>10} {1:>9} {serial_time:>8.2f} {1:>7.2f} {'-':>5}")
+
+            for processes in args.processes:
+                parallel_time, parallel_body = render(json_path,topics,args.sections,processes)
+                print(f"{topics:>6} {paragraphs:>10} {processes:>9} {parallel_time:>8.2f} {serial_time / parallel_time:>7.2f} {str(parallel_body == serial_body):>5}")
+
+        print()
+        print("Estimated time on N CPUs (startup + render makespan + merge, each measured on its own)")
+        print(f"{'topics':>6} {'paragraphs':>10} {'processes':>9} {'startup':>8} {'render':>8} {'merge':>8} {'estimate':>8} {'speedup':>7}")
+
+        startup_times = {processes: measureStartup(processes) for processes in args.processes}
+
+        for topics in args.topics:
+            paragraphs = topics * args.sections * PARAGRAPHS_PER_SECTION
+            render_times, merge_time = measureParts(json_path,topics,args.sections)
+
+            for processes in args.processes:
+                makespan = renderMakespan(render_times,min(processes,topics))
+                estimate = startup_times[processes] + makespan + merge_time
+                print(f"{topics:>6} {paragraphs:>10} {processes:>9} {startup_times[processes]:>8.2f} {makespan:>8.2f} {merge_time:>8.2f} {estimate:>8.2f} {serial_times[topics] / estimate:>7.2f}")